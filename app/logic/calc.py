@@ -1,64 +1,79 @@
-from typing import Dict, List
+from collections import defaultdict
+from typing import Dict, List, Tuple
 
 
-def compute_base_consumption(recipe: dict, volume_ml: float) -> Dict[str, float]:
-    base_ml = float(recipe.get("base_volume_ml", 200)) or 200.0
-    k = volume_ml / base_ml
-    out: Dict[str, float] = {}
-    for item in recipe.get("ingredients", []):
-        iid = item["ingredient_id"]
-        qty = float(item["qty"])
-        out[iid] = out.get(iid, 0.0) + qty * k
-    return out
+def flatten_ingredients(ingredients: List[dict]) -> Tuple[Tuple[str, float], ...]:
+    return tuple((item["ingredient_id"], float(item["qty"])) for item in ingredients)
 
 
-def consumption_for_item(product: dict, volume_ml: float, addon_ids: List[str], recipes: Dict[str, dict]) -> Dict[str, float]:
-    total: Dict[str, float] = {}
+def _add_base_consumption(out: Dict[str, float], recipe: dict, volume_ml: float, mult: float = 1.0) -> None:
+    base_ml = float(recipe.get("base_volume_ml", 200)) or 200.0
+    k = volume_ml / base_ml * mult
+    pairs = recipe.get("_flat")
+    if pairs is None:
+        pairs = flatten_ingredients(recipe.get("ingredients", []))
+    for iid, qty in pairs:
+        out[iid] += qty * k
 
-    rkey = None
-    if product.get("recipe_ref"):
-        if isinstance(product["recipe_ref"], str):
-            rkey = product["recipe_ref"].split("/")[-1]
-        elif isinstance(product["recipe_ref"], dict) and "path" in product["recipe_ref"]:
-            rkey = str(product["recipe_ref"]["path"]).split("/")[-1]
 
+def _add_item_consumption(
+    out: Dict[str, float],
+    product: dict,
+    volume_ml: float,
+    addon_ids: List[str],
+    recipes: Dict[str, dict],
+    mult: float = 1.0,
+) -> None:
+    # пишет прямо в общий аккумулятор `out`, уже умножая на количество позиций
+    rkey = product.get("recipe_id")
     if rkey and rkey in recipes:
-        total = sum_maps(total, compute_base_consumption(recipes[rkey], volume_ml))
+        _add_base_consumption(out, recipes[rkey], volume_ml, mult)
 
-    addons = {a["id"]: a for a in product.get("addons", [])}
+    addons = product.get("_addons_by_id")
+    if addons is None:
+        addons = {a["id"]: a for a in product.get("addons", [])}
     for add_id in addon_ids:
         ad = addons.get(add_id)
         if not ad:
             continue
         for iid, q in (ad.get("ingredients") or {}).items():
-            total[iid] = total.get(iid, 0.0) + float(q)
+            out[iid] += float(q) * mult
 
-    return total
 
+def compute_base_consumption(recipe: dict, volume_ml: float) -> Dict[str, float]:
+    out: Dict[str, float] = defaultdict(float)
+    _add_base_consumption(out, recipe, volume_ml)
+    return dict(out)
 
-def sum_maps(a: Dict[str, float], b: Dict[str, float]) -> Dict[str, float]:
-    out = dict(a)
-    for k, v in b.items():
-        out[k] = out.get(k, 0.0) + v
-    return out
+
+def consumption_for_item(product: dict, volume_ml: float, addon_ids: List[str], recipes: Dict[str, dict]) -> Dict[str, float]:
+    total: Dict[str, float] = defaultdict(float)
+    _add_item_consumption(total, product, volume_ml, addon_ids, recipes)
+    return dict(total)
 
 
 def total_cart_consumption(cart: List[dict], products: Dict[str, dict], recipes: Dict[str, dict]) -> Dict[str, float]:
-    need: Dict[str, float] = {}
+    need: Dict[str, float] = defaultdict(float)
     for item in cart:
         prod = products.get(item["product_id"])
         if not prod:
             continue
-        cons = consumption_for_item(prod, item["volume_ml"], item.get("addons", []), recipes)
-        for k, v in cons.items():
-            need[k] = need.get(k, 0.0) + v * int(item["qty"])
-    return need
+        _add_item_consumption(need, prod, item["volume_ml"], item.get("addons", []), recipes, int(item["qty"]))
+    return dict(need)
+
+
+def price_of_item(product: dict, addon_ids: List[str]) -> int:
+    tbl = product.get("_addon_price")
+    if tbl is None:
+        tbl = {a["id"]: int(a.get("price_delta", 0)) for a in product.get("addons", [])}
+    return int(product["base_price"]) + sum(tbl.get(a, 0) for a in addon_ids)
 
 
 def find_shortages(need: Dict[str, float], inventory: Dict[str, dict]):
     shortages = []
     for iid, req in need.items():
-        have = float(inventory.get(iid, {}).get("current", 0.0))
+        row = inventory.get(iid)
+        have = row["current"] if row else 0.0
         if have + 1e-9 < req:
             shortages.append({"ingredient_id": iid, "need": req, "have": have, "deficit": req - have})
     return shortages
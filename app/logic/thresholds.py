@@ -1,12 +1,9 @@
 from typing import Tuple
 
+# индекс = сколько порогов (0.25 / 0.50 / 0.75) ratio строго превысил
+_ICONS = ("🔴", "🟠", "🟡", "🔵")
+
 
 def inv_status(capacity: float, current: float) -> Tuple[str, float]:
     ratio = current / capacity if capacity > 0 else 0.0
-    if ratio > 0.75:
-        return "🔵", ratio
-    if ratio > 0.50:
-        return "🟡", ratio
-    if ratio > 0.25:
-        return "🟠", ratio
-    return "🔴", ratio
+    return _ICONS[(ratio > 0.25) + (ratio > 0.50) + (ratio > 0.75)], ratio
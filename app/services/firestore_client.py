@@ -1,4 +1,5 @@
 from typing import Any, Dict
+from concurrent.futures import ThreadPoolExecutor
 import json
 import streamlit as st
 from google.cloud import firestore
@@ -25,10 +26,13 @@ def get_db() -> firestore.Client:
             info = dict(svc)
 
         creds = service_account.Credentials.from_service_account_info(info)
-        db = firestore.Client(credentials=creds, project=project_id)
-        # быстрый sanity-check
-        _ = list(db.collections())
-        return db
+        return firestore.Client(credentials=creds, project=project_id)
     except Exception as e:
         st.error(f"Не удалось инициализировать Firestore: {e}")
         st.stop()
+
+
+@st.cache_resource
+def get_io_pool() -> ThreadPoolExecutor:
+    # общий пул на процесс для параллельных чтений Firestore (клиент потокобезопасен)
+    return ThreadPoolExecutor(max_workers=16, thread_name_prefix="firestore-io")
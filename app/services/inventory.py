@@ -1,10 +1,12 @@
 from typing import Dict
+import streamlit as st
 from google.cloud import firestore
 
 
-def fetch_inventory(db: firestore.Client) -> Dict[str, dict]:
+@st.cache_data(ttl=30, show_spinner=False)
+def fetch_inventory(_db: firestore.Client) -> Dict[str, dict]:
     inv: Dict[str, dict] = {}
-    for doc in db.collection("inventory").stream():
+    for doc in _db.collection("inventory").stream():
         d = doc.to_dict() or {}
         inv[doc.id] = {
             "id": doc.id,
@@ -1,30 +1,53 @@
-from typing import Dict
+from typing import Any, Dict, Optional
+import streamlit as st
 from google.cloud import firestore
+from app.logic.calc import flatten_ingredients
 
 
-def fetch_recipes(db: firestore.Client) -> Dict[str, dict]:
+def _recipe_id(ref: Any) -> Optional[str]:
+    # 'recipes/xxx', {"path": "recipes/xxx"} или DocumentReference
+    if not ref:
+        return None
+    if isinstance(ref, str):
+        return ref.split("/")[-1]
+    if isinstance(ref, dict):
+        return str(ref["path"]).split("/")[-1] if "path" in ref else None
+    ref_id = getattr(ref, "id", None)
+    return str(ref_id) if ref_id else None
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def fetch_recipes(_db: firestore.Client) -> Dict[str, dict]:
     rec: Dict[str, dict] = {}
-    for doc in db.collection("recipes").stream():
+    for doc in _db.collection("recipes").stream():
         d = doc.to_dict() or {}
+        ingredients = d.get("ingredients", [])
         rec[doc.id] = {
             "id": doc.id,
             "base_volume_ml": float(d.get("base_volume_ml", 200)),
-            "ingredients": d.get("ingredients", []),  # [{ingredient_id, qty, unit}]
+            "ingredients": ingredients,  # [{ingredient_id, qty, unit}]
+            "_flat": flatten_ingredients(ingredients),  # ((ingredient_id, qty), ...) для расчёта расхода
         }
     return rec
 
 
-def fetch_products(db: firestore.Client) -> Dict[str, dict]:
+@st.cache_data(ttl=30, show_spinner=False)
+def fetch_products(_db: firestore.Client) -> Dict[str, dict]:
     prods: Dict[str, dict] = {}
-    for doc in db.collection("products").where("is_active", "==", True).stream():
+    for doc in _db.collection("products").where("is_active", "==", True).stream():
         d = doc.to_dict() or {}
+        addons = d.get("addons", [])
         prods[doc.id] = {
             "id": doc.id,
             "name": d.get("name", doc.id),
             "category": d.get("category", "Прочее"),
             "volumes": d.get("volumes", [200]),
             "base_price": int(d.get("base_price", 0)),
-            "addons": d.get("addons", []),  # [{id,name,price_delta,ingredients:{}}]
-            "recipe_ref": d.get("recipe_ref", None),  # 'recipes/xxx' или reference
+            "addons": addons,  # [{id,name,price_delta,ingredients:{}}]
+            "_addon_price": {a["id"]: int(a.get("price_delta", 0)) for a in addons},
+            "_addons_by_id": {a["id"]: a for a in addons},
+            # результат идёт через pickle (st.cache_data) — DocumentReference хранить нельзя, только id
+            "recipe_id": _recipe_id(d.get("recipe_ref")),
         }
-    return prods
+    # порядок вставки — по имени: экран продаж группирует товары за один проход без сортировки
+    return dict(sorted(prods.items(), key=lambda kv: kv[1]["name"]))
@@ -1,4 +1,5 @@
 from typing import List, Tuple, Dict
+import streamlit as st
 from google.cloud import firestore
 from app.logic.calc import total_cart_consumption
 
@@ -14,33 +15,39 @@ def commit_sale(
 
     @firestore.transactional
     def _txn(transaction: firestore.Transaction):
-        inv_refs = {iid: db.collection("inventory").document(iid) for iid in need.keys()}
-        snaps = {iid: inv_refs[iid].get(transaction=transaction) for iid in inv_refs}
+        inv_col = db.collection("inventory")
+        inv_refs = {iid: inv_col.document(iid) for iid in need.keys()}
+        # одним batch-запросом вместо N последовательных get(); пустой need — без чтения
+        snaps = {}
+        if inv_refs:
+            snaps = {s.id: s for s in transaction.get_all(list(inv_refs.values()))}
 
-        # check
+        # check + update за один проход: каждый снапшот декодируется один раз
+        staged = []
         for iid, req in need.items():
-            cur = float(snaps[iid].to_dict().get("current", 0.0) if snaps[iid].exists else 0.0)
+            snap = snaps[iid]
+            cur = float((snap.to_dict() or {}).get("current", 0.0)) if snap.exists else 0.0
             if cur + 1e-9 < req:
                 raise RuntimeError(f"Недостаточно '{iid}': нужно {req}, есть {cur}")
+            staged.append((inv_refs[iid], req))
 
-        # update
-        for iid, req in need.items():
-            cur = float(snaps[iid].to_dict().get("current", 0.0))
-            transaction.update(inv_refs[iid], {"current": cur - req, "updated_at": firestore.SERVER_TIMESTAMP})
+        for ref, req in staged:
+            transaction.update(ref, {"current": firestore.Increment(-float(req)), "updated_at": firestore.SERVER_TIMESTAMP})
 
         total_amount = sum(int(i["price_total"]) for i in cart)
+        delta = {k: -v for k, v in need.items()}
         sale_ref = db.collection("sales").document()
         transaction.set(sale_ref, {
             "created_at": firestore.SERVER_TIMESTAMP,
             "items": cart,
             "total_amount": total_amount,
-            "inventory_delta": {k: -v for k, v in need.items()},
+            "inventory_delta": delta,
         })
         log_ref = db.collection("inventory_log").document()
         transaction.set(log_ref, {
             "created_at": firestore.SERVER_TIMESTAMP,
             "type": "sale",
-            "delta": {k: -v for k, v in need.items()},
+            "delta": delta,
             "sale_id": sale_ref.id
         })
         return sale_ref.id
@@ -50,3 +57,22 @@ def commit_sale(
         return True, sid
     except Exception as e:
         return False, str(e)
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def fetch_recent_sales(_db: firestore.Client, limit: int = 30) -> List[dict]:
+    out: List[dict] = []
+    query = (
+        _db.collection("sales")
+        .select(["total_amount", "items"])
+        .order_by("created_at", direction=firestore.Query.DESCENDING)
+        .limit(limit)
+    )
+    for doc in query.stream():
+        d = doc.to_dict() or {}
+        out.append({
+            "id": doc.id,
+            "total_amount": int(d.get("total_amount", 0)),
+            "items_count": len(d.get("items", [])),
+        })
+    return out
@@ -28,15 +28,22 @@ def render_inventory(db: firestore.Client):
     st.dataframe(rows, use_container_width=True, hide_index=True)
 
     with st.expander("➕ Пополнение / корректировка"):
-        choice = st.selectbox("Ингредиент", options=list(inv.keys()), format_func=lambda k: inv[k]["name"])
-        delta = st.number_input("Изменение (плюс к текущему)", value=0.0, step=10.0)
-        if st.button("Сохранить"):
+        # форма: выбор и ввод не перезапускают скрипт, rerun только по «Сохранить»
+        with st.form("inventory_adjust"):
+            choice = st.selectbox("Ингредиент", options=list(inv.keys()), format_func=lambda k: inv[k]["name"])
+            delta = st.number_input("Изменение (плюс к текущему)", value=0.0, step=10.0)
+            submitted = st.form_submit_button("Сохранить")
+        if submitted:
+            # остаток и запись в журнал — одним коммитом
+            batch = db.batch()
             ref = db.collection("inventory").document(choice)
-            ref.update({"current": firestore.Increment(float(delta)), "updated_at": firestore.SERVER_TIMESTAMP})
-            db.collection("inventory_log").add({
+            batch.update(ref, {"current": firestore.Increment(float(delta)), "updated_at": firestore.SERVER_TIMESTAMP})
+            batch.set(db.collection("inventory_log").document(), {
                 "created_at": firestore.SERVER_TIMESTAMP,
                 "type": "restock" if delta >= 0 else "adjust",
                 "delta": {choice: float(delta)}
             })
+            batch.commit()
+            fetch_inventory.clear()
             st.success("Обновлено.")
             st.experimental_rerun()
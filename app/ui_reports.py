@@ -1,7 +1,9 @@
 import streamlit as st
 from google.cloud import firestore
 
+from app.services.firestore_client import get_io_pool
 from app.services.inventory import fetch_inventory
+from app.services.sales import fetch_recent_sales
 from app.logic.thresholds import inv_status
 from app.utils.format import fmt_money_kop
 
@@ -9,25 +11,25 @@ from app.utils.format import fmt_money_kop
 def render_reports(db: firestore.Client):
     st.subheader("Рецепты • Отчёты (MVP)")
 
+    pool = get_io_pool()
+    f_sales = pool.submit(fetch_recent_sales, db, 30)
+    f_inv = pool.submit(fetch_inventory, db)
+
     col1, col2 = st.columns(2)
     with col1:
         st.caption("Последние 30 продаж:")
-        sales = list(
-            db.collection("sales")
-            .order_by("created_at", direction=firestore.Query.DESCENDING)
-            .limit(30)
-            .stream()
-        )
+        sales = f_sales.result()
         if not sales:
             st.info("Пока нет продаж.")
         else:
-            for s in sales:
-                d = s.to_dict()
-                st.write(f"- **{fmt_money_kop(int(d.get('total_amount',0)))}**, позиций: {len(d.get('items',[]))}")
+            # один markdown-элемент на весь список вместо элемента на строку
+            st.markdown("\n".join(
+                f"- **{fmt_money_kop(s['total_amount'])}**, позиций: {s['items_count']}" for s in sales
+            ))
 
     with col2:
         st.caption("Ингредиенты на исходе (🟠/🔴):")
-        inv = fetch_inventory(db)
+        inv = f_inv.result()
         danger = []
         for x in inv.values():
             icon, ratio = inv_status(x["capacity"], x["current"])
@@ -36,5 +38,4 @@ def render_reports(db: firestore.Client):
         if not danger:
             st.success("Критичных остатков нет.")
         else:
-            for line in danger:
-                st.write("• " + line)
+            st.markdown("  \n".join("• " + line for line in danger))
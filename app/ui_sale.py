@@ -1,11 +1,13 @@
+from collections import defaultdict
 from typing import Dict, List
 import streamlit as st
 from google.cloud import firestore
 
+from app.services.firestore_client import get_io_pool
 from app.services.inventory import fetch_inventory
 from app.services.products import fetch_products, fetch_recipes
-from app.logic.calc import total_cart_consumption, find_shortages
-from app.services.sales import commit_sale
+from app.logic.calc import total_cart_consumption, find_shortages, price_of_item
+from app.services.sales import commit_sale, fetch_recent_sales
 from app.utils.format import fmt_money_kop
 
 
@@ -17,10 +19,11 @@ def _ensure_state():
 
 
 def _build_categories(products: Dict[str, dict]) -> Dict[str, List[dict]]:
-    cats = {}
+    # products уже по имени (fetch_products) — списки внутри категорий выходят отсортированными
+    cats: Dict[str, List[dict]] = defaultdict(list)
     for p in products.values():
-        cats.setdefault(p["category"], []).append(p)
-    return cats
+        cats[p["category"]].append(p)
+    return {c: cats[c] for c in sorted(cats)}
 
 
 def render_sale(db: firestore.Client):
@@ -30,9 +33,12 @@ def render_sale(db: firestore.Client):
     st.info("Продажа проводится только при нажатии **«Купить»**. До этого позиции лежат в корзине и остатки не меняются.")
 
     with st.spinner("Загрузка каталога..."):
-        inventory = fetch_inventory(db)
-        recipes = fetch_recipes(db)
-        products = fetch_products(db)
+        # три независимых стрима — при промахе кэша идут параллельно, а не по очереди
+        pool = get_io_pool()
+        f_inv = pool.submit(fetch_inventory, db)
+        f_rec = pool.submit(fetch_recipes, db)
+        f_prod = pool.submit(fetch_products, db)
+        inventory, recipes, products = f_inv.result(), f_rec.result(), f_prod.result()
 
     if not products:
         st.warning("В коллекции **products** нет активных товаров.")
@@ -46,7 +52,7 @@ def render_sale(db: firestore.Client):
         st.markdown("### Категории")
         cat_row = st.columns(4)
         i = 0
-        for cat in sorted(cats.keys()):
+        for cat in cats:
             with cat_row[i % 4]:
                 if st.button(f"🗂️ {cat}", use_container_width=True):
                     st.session_state.ui["category"] = cat
@@ -54,12 +60,12 @@ def render_sale(db: firestore.Client):
             i += 1
 
         st.markdown("---")
-        cat = st.session_state.ui.get("category") or sorted(cats.keys())[0]
+        cat = st.session_state.ui.get("category") or next(iter(cats))
         st.caption(f"Выбрана категория: **{cat}**")
 
         prod_row = st.columns(4)
         i = 0
-        for p in sorted(cats[cat], key=lambda x: x["name"]):
+        for p in cats[cat]:
             with prod_row[i % 4]:
                 if st.button(f"☕ {p['name']}", use_container_width=True):
                     st.session_state.ui["product"] = p["id"]
@@ -83,10 +89,7 @@ def render_sale(db: firestore.Client):
                     ):
                         add_ids.append(add["id"])
 
-            price = int(prod["base_price"])
-            for add in prod.get("addons", []):
-                if add["id"] in add_ids:
-                    price += int(add.get("price_delta", 0))
+            price = price_of_item(prod, add_ids)
             total_item = price * int(qty)
 
             st.write(f"**Цена за шт.:** {fmt_money_kop(price)}  |  **Итого:** {fmt_money_kop(total_item)}")
@@ -138,6 +141,8 @@ def render_sale(db: firestore.Client):
                 if st.button("💳 Купить", type="primary", use_container_width=True):
                     ok, msg = commit_sale(db, cart, products, recipes)
                     if ok:
+                        fetch_inventory.clear()
+                        fetch_recent_sales.clear()
                         st.success(f"Продажа проведена (sale_id={msg}).")
                         st.session_state.cart = []
                         st.balloons()
@@ -4,21 +4,24 @@ from datetime import datetime
 
 db = firestore.Client()  # использует GOOGLE_APPLICATION_CREDENTIALS
 
-def upsert(col, doc, data):
+def upsert(batch, col, doc, data):
     ref = db.collection(col).document(doc)
-    ref.set(data, merge=True)
+    batch.set(ref, data, merge=True)
 
 def main():
+    # все сиды одним WriteBatch (лимит 500 записей на batch)
+    batch = db.batch()
+
     # inventory
-    upsert("inventory","espresso_beans",{"name":"Зёрна эспрессо","unit":"g","capacity":5000,"current":3000,"updated_at":datetime.utcnow()})
-    upsert("inventory","milk",          {"name":"Молоко","unit":"ml","capacity":10000,"current":6000,"updated_at":datetime.utcnow()})
-    upsert("inventory","syrup_vanilla", {"name":"Сироп ваниль","unit":"ml","capacity":2000,"current":800,"updated_at":datetime.utcnow()})
-    upsert("inventory","sugar",         {"name":"Сахар","unit":"g","capacity":3000,"current":1200,"updated_at":datetime.utcnow()})
-    upsert("inventory","cups_200",      {"name":"Стаканы 200 мл","unit":"pcs","capacity":500,"current":300,"updated_at":datetime.utcnow()})
-    upsert("inventory","cups_400",      {"name":"Стаканы 400 мл","unit":"pcs","capacity":500,"current":200,"updated_at":datetime.utcnow()})
+    upsert(batch,"inventory","espresso_beans",{"name":"Зёрна эспрессо","unit":"g","capacity":5000,"current":3000,"updated_at":datetime.utcnow()})
+    upsert(batch,"inventory","milk",          {"name":"Молоко","unit":"ml","capacity":10000,"current":6000,"updated_at":datetime.utcnow()})
+    upsert(batch,"inventory","syrup_vanilla", {"name":"Сироп ваниль","unit":"ml","capacity":2000,"current":800,"updated_at":datetime.utcnow()})
+    upsert(batch,"inventory","sugar",         {"name":"Сахар","unit":"g","capacity":3000,"current":1200,"updated_at":datetime.utcnow()})
+    upsert(batch,"inventory","cups_200",      {"name":"Стаканы 200 мл","unit":"pcs","capacity":500,"current":300,"updated_at":datetime.utcnow()})
+    upsert(batch,"inventory","cups_400",      {"name":"Стаканы 400 мл","unit":"pcs","capacity":500,"current":200,"updated_at":datetime.utcnow()})
 
     # recipes
-    upsert("recipes","cappuccino_base",{
+    upsert(batch,"recipes","cappuccino_base",{
         "base_volume_ml": 200,
         "ingredients":[
             {"ingredient_id":"milk","qty":150,"unit":"ml"},
@@ -26,7 +29,7 @@ def main():
             {"ingredient_id":"cups_200","qty":1,"unit":"pcs"}
         ]
     })
-    upsert("recipes","latte_base",{
+    upsert(batch,"recipes","latte_base",{
         "base_volume_ml": 200,
         "ingredients":[
             {"ingredient_id":"milk","qty":170,"unit":"ml"},
@@ -36,7 +39,7 @@ def main():
     })
 
     # products
-    upsert("products","cappuccino",{
+    upsert(batch,"products","cappuccino",{
         "name":"Капучино",
         "category":"Кофе",
         "volumes":[200,400],
@@ -47,7 +50,7 @@ def main():
         "recipe_ref":"recipes/cappuccino_base",
         "is_active": True
     })
-    upsert("products","latte",{
+    upsert(batch,"products","latte",{
         "name":"Латте",
         "category":"Кофе",
         "volumes":[200,400],
@@ -59,6 +62,7 @@ def main():
         "is_active": True
     })
 
+    batch.commit()
     print("✅ Seed done")
 
 if __name__ == "__main__":
@@ -110,21 +110,33 @@ def try_import_modules():
 
 
 # ---------- проверка secrets ----------
+def _flag(value) -> bool:
+    # "1"/"true"/"yes" (или bool True из secrets.toml); "0", "false", "" — выключено
+    return str(value or "").strip().lower() in ("1", "true", "yes")
+
+
 def sidebar_secrets_check():
+    # диагностика нужна только при отладке деплоя — включается env GIPSY_DEBUG или секретом DEBUG
+    if not (_flag(os.getenv("GIPSY_DEBUG")) or _flag(st.secrets.get("DEBUG"))):
+        return
+    svc = st.secrets.get("FIREBASE_SERVICE_ACCOUNT")
+    lines = [
+        f"- PROJECT_ID present: {bool(st.secrets.get('PROJECT_ID'))}",
+        f"- FIREBASE_SERVICE_ACCOUNT type: `{type(svc).__name__}`",
+    ]
+    if isinstance(svc, str):
+        has_escaped_nl = "\\n" in svc
+        lines.append(f"- contains `\\n` literal: {has_escaped_nl}")
+        try:
+            j = json.loads(svc)
+            lines.append("- json ok: True")
+            lines.append(f"- pk begins with BEGIN: {str(j.get('private_key', '')).strip().startswith('-----BEGIN')}")
+        except Exception as e:
+            lines.append(f"- json ok: False `{e}`")
+    elif isinstance(svc, dict):
+        lines.append(f"- pk begins with BEGIN: {str(svc.get('private_key', '')).strip().startswith('-----BEGIN')}")
     with st.sidebar.expander("🔍 Secrets check", expanded=False):
-        st.write("PROJECT_ID present:", bool(st.secrets.get("PROJECT_ID")))
-        svc = st.secrets.get("FIREBASE_SERVICE_ACCOUNT")
-        st.write("FIREBASE_SERVICE_ACCOUNT type:", type(svc).__name__)
-        if isinstance(svc, str):
-            st.write("contains \\n literal:", "\\n" in svc)
-            try:
-                j = json.loads(svc)
-                st.write("json ok:", True)
-                st.write("pk begins with BEGIN:", str(j.get("private_key", "")).strip().startswith("-----BEGIN"))
-            except Exception as e:
-                st.write("json ok:", False, str(e))
-        elif isinstance(svc, dict):
-            st.write("pk begins with BEGIN:", str(svc.get("private_key", "")).strip().startswith("-----BEGIN"))
+        st.markdown("\n".join(lines))
 
 
 # ---------- fallback экраны ----------